@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import partial
+import logging
+
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
@@ -22,8 +26,18 @@ from .const import (
 )
 from .coordinator import XToolDataUpdateCoordinator
 
+LOGGER = logging.getLogger(__name__)
+
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.BUTTON]
 
+SERVICE_ACTIONS: dict[str, str] = {
+    SERVICE_PAUSE_JOB: "pause",
+    SERVICE_RESUME_JOB: "resume",
+    SERVICE_STOP_JOB: "stop",
+}
+
+SERVICE_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTRY_ID): str})
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up xTool Laser from a config entry."""
@@ -41,7 +55,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         use_websocket=use_websocket,
     )
 
-    hass.data[DOMAIN][entry.entry_id] = {"api": api, "coordinator": coordinator}
+    entry.runtime_data = coordinator
+    hass.data[DOMAIN][entry.entry_id] = coordinator
     _async_register_services(hass)
 
     await coordinator.async_config_entry_first_refresh()
@@ -55,8 +70,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    data = hass.data[DOMAIN][entry.entry_id]
-    coordinator: XToolDataUpdateCoordinator = data["coordinator"]
+    coordinator: XToolDataUpdateCoordinator = entry.runtime_data
 
     await coordinator.async_stop()
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -76,59 +90,47 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
 
 def _async_register_services(hass: HomeAssistant) -> None:
     """Register xTool services once per domain."""
-    schema = vol.Schema({vol.Optional(ATTR_ENTRY_ID): str})
-
-    async def handle_pause(call: ServiceCall) -> None:
-        await _async_handle_job_service(hass, call, "pause")
-
-    async def handle_resume(call: ServiceCall) -> None:
-        await _async_handle_job_service(hass, call, "resume")
-
-    async def handle_stop(call: ServiceCall) -> None:
-        await _async_handle_job_service(hass, call, "stop")
-
-    if not hass.services.has_service(DOMAIN, SERVICE_PAUSE_JOB):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_PAUSE_JOB,
-            handle_pause,
-            schema=schema,
-        )
-
-    if not hass.services.has_service(DOMAIN, SERVICE_RESUME_JOB):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_RESUME_JOB,
-            handle_resume,
-            schema=schema,
-        )
-
-    if not hass.services.has_service(DOMAIN, SERVICE_STOP_JOB):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_STOP_JOB,
-            handle_stop,
-            schema=schema,
-        )
+    for service, action in SERVICE_ACTIONS.items():
+        if not hass.services.has_service(DOMAIN, service):
+            hass.services.async_register(
+                DOMAIN,
+                service,
+                partial(_async_handle_job_service, hass, action=action),
+                schema=SERVICE_SCHEMA,
+            )
 
 
 def _async_unregister_services(hass: HomeAssistant) -> None:
     """Remove registered xTool services."""
-    for service in (SERVICE_PAUSE_JOB, SERVICE_RESUME_JOB, SERVICE_STOP_JOB):
+    for service in SERVICE_ACTIONS:
         if hass.services.has_service(DOMAIN, service):
             hass.services.async_remove(DOMAIN, service)
 
 
-async def _async_handle_job_service(hass: HomeAssistant, call: ServiceCall, action: str) -> None:
+async def _async_handle_job_service(hass: HomeAssistant, call: ServiceCall, *, action: str) -> None:
     """Handle pause/resume/stop service calls."""
     entry_id = call.data.get(ATTR_ENTRY_ID)
     entries = _get_target_entries(hass, entry_id)
 
-    for target_entry_id in entries:
-        item = hass.data[DOMAIN][target_entry_id]
-        api: XToolApiClient = item["api"]
-        coordinator: XToolDataUpdateCoordinator = item["coordinator"]
-        await api.async_cnc_action(action)
+    results = await asyncio.gather(
+        *(_async_run_job_action(hass.data[DOMAIN][target_entry_id], action) for target_entry_id in entries),
+        return_exceptions=True,
+    )
+
+    failed = 0
+    for target_entry_id, result in zip(entries, results):
+        if isinstance(result, Exception):
+            failed += 1
+            LOGGER.error("Failed to %s job on xTool entry %s: %s", action, target_entry_id, result)
+
+    if failed:
+        raise HomeAssistantError(f"Failed to {action} job on {failed} of {len(entries)} xTool device(s)")
+
+
+async def _async_run_job_action(coordinator: XToolDataUpdateCoordinator, action: str) -> None:
+    """Run a job action against one device and refresh its state."""
+    await coordinator.api.async_cnc_action(action)
+    if not coordinator.api.ws_connected:
         await coordinator.async_request_refresh()
 
 
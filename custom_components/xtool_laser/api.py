@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
+import logging
 import random
 import socket
-import time
 from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
 import aiohttp
@@ -16,63 +16,143 @@ from aiohttp import ClientError
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
 
-from .const import DEFAULT_PORT, DEFAULT_WS_PORT
+from .const import (
+    DEFAULT_PORT,
+    DEFAULT_WS_PORT,
+    WS_MAX_CONNECT_FAILURES,
+    WS_QUEUE_SIZE,
+    WS_RECONNECT_MAX_DELAY,
+    WS_RECONNECT_MIN_DELAY,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+_MAC_PARAMS = {"action": "mac"}
+_WORKING_STATE_PARAMS = {"action": "get_working_sta"}
+_CNC_PARAMS = {action: {"action": action} for action in ("pause", "resume", "stop")}
 
 
 class XToolApiError(Exception):
     """Raised when xTool API communication fails."""
 
 
+@dataclass(frozen=True, slots=True)
+class SnapshotResponses:
+    """Responses of one snapshot poll, comparable between polls.
+
+    Progress and working state are kept undecoded. The optional peripheral
+    status is decoded on fetch, so a malformed body counts as a failed
+    request and is None.
+    """
+
+    machine_type: str
+    progress: bytes
+    working_state: bytes
+    peripheral: dict[str, Any] | None
+
+
+class _DiscoveryProtocol(asyncio.DatagramProtocol):
+    """Collect UDP discovery replies matching a request ID."""
+
+    def __init__(self, request_id: int) -> None:
+        self._request_id = request_id
+        self.found: dict[str, dict[str, Any]] = {}
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Record a device from a discovery reply."""
+        try:
+            message = json_loads(data)
+        except ValueError:
+            return
+
+        if not isinstance(message, dict) or message.get("requestId") != self._request_id:
+            return
+
+        host = str(message.get("ip", "")).strip()
+        if not host:
+            return
+
+        self.found[host] = {
+            "host": host,
+            "name": str(message.get("name", "xTool Laser")),
+            "version": str(message.get("version", "")),
+        }
+
+
 class XToolApiClient:
     """Simple xTool HTTP/WebSocket client."""
 
     def __init__(self, hass: HomeAssistant, host: str) -> None:
         self._hass = hass
         self._host = host.strip()
+        self.base_url = f"http://{self._host}:{DEFAULT_PORT}"
+        self.ws_url = f"ws://{self._host}:{DEFAULT_WS_PORT}"
         self._session = async_get_clientsession(hass)
         self._ws_task: asyncio.Task[None] | None = None
         self._ws_stop = asyncio.Event()
+        self._ws_backoff = WS_RECONNECT_MIN_DELAY
+        self._ws_failures = 0
+        self._ws_ever_connected = False
+        self.ws_connected = False
+        self.ws_messages: asyncio.Queue[str] = asyncio.Queue(maxsize=WS_QUEUE_SIZE)
+        self._machine_type: str | None = None
+        self._mac: str | None = None
 
     @property
     def host(self) -> str:
         """Return configured host."""
         return self._host
 
-    @property
-    def base_url(self) -> str:
-        """Return base HTTP API URL."""
-        return f"http://{self._host}:{DEFAULT_PORT}"
-
-    @property
-    def ws_url(self) -> str:
-        """Return WebSocket URL."""
-        return f"ws://{self._host}:{DEFAULT_WS_PORT}"
-
-    async def _get_json(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+    async def _get_raw(self, path: str, params: dict[str, Any] | None = None) -> bytes:
         url = f"{self.base_url}{path}"
         try:
             async with self._session.get(url, params=params, timeout=10) as response:
                 response.raise_for_status()
-                return await response.json(content_type=None)
-        except (TimeoutError, ClientError, aiohttp.ContentTypeError, ValueError) as err:
+                return await response.read()
+        except (TimeoutError, ClientError) as err:
             raise XToolApiError(f"Request failed for {url}: {err}") from err
 
+    async def _get_optional_json(self, path: str) -> dict[str, Any] | None:
+        """Return a decoded JSON object, or None if the request or decoding fails."""
+        try:
+            payload = await self._get_json(path)
+        except XToolApiError as err:
+            LOGGER.debug("Optional request failed: %s", err)
+            return None
+        if not isinstance(payload, dict):
+            LOGGER.debug("Optional request to %s%s returned a non-object payload", self.base_url, path)
+            return None
+        return payload
+
+    async def _get_json(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        raw = await self._get_raw(path, params)
+        try:
+            return json_loads(raw)
+        except ValueError as err:
+            raise XToolApiError(f"Invalid JSON from {self.base_url}{path}: {err}") from err
+
     async def async_ping(self) -> bool:
         """Return whether device is reachable."""
         payload = await self._get_json("/ping")
         return payload.get("result") == "ok"
 
     async def async_get_machine_type(self) -> str:
-        """Get machine model string."""
-        payload = await self._get_json("/getmachinetype")
-        return str(payload.get("type", "Unknown xTool"))
+        """Get machine model string, cached after the first successful call."""
+        if self._machine_type is None:
+            payload = await self._get_json("/getmachinetype")
+            self._machine_type = str(payload.get("type", "Unknown xTool"))
+        return self._machine_type
 
     async def async_get_mac(self) -> str | None:
-        """Return device MAC address if available."""
-        payload = await self._get_json("/system", params={"action": "mac"})
-        mac = payload.get("mac")
-        return str(mac) if mac else None
+        """Return device MAC address if available, cached once known."""
+        if self._mac is None:
+            payload = await self._get_json("/system", params=_MAC_PARAMS)
+            mac = payload.get("mac")
+            self._mac = str(mac) if mac else None
+        return self._mac
 
     async def async_get_progress(self) -> dict[str, Any]:
         """Get active job progress details."""
@@ -80,96 +160,97 @@ class XToolApiClient:
 
     async def async_get_working_state(self) -> str:
         """Get current working state code as string."""
-        payload = await self._get_json("/system", params={"action": "get_working_sta"})
+        payload = await self._get_json("/system", params=_WORKING_STATE_PARAMS)
         return str(payload.get("working", "0"))
 
     async def async_get_peripheral_status(self) -> dict[str, Any]:
         """Get safety/peripheral status payload."""
         return await self._get_json("/peripherystatus")
 
-    async def async_get_snapshot(self) -> dict[str, Any]:
-        """Fetch a combined device snapshot for entities."""
-        progress, working_state, peripheral, machine_type = await asyncio.gather(
-            self.async_get_progress(),
-            self.async_get_working_state(),
-            self.async_get_peripheral_status(),
-            self.async_get_machine_type(),
+    async def async_get_snapshot(self, include_peripheral: bool = True) -> SnapshotResponses:
+        """Fetch the undecoded responses that make up a device snapshot.
+
+        When include_peripheral is False, or the peripheral request fails,
+        the peripheral status is None.
+        """
+        # The TaskGroup cancels the sibling requests as soon as one fails.
+        peripheral_task: asyncio.Task[dict[str, Any] | None] | None = None
+        try:
+            async with asyncio.TaskGroup() as group:
+                machine_type_task = group.create_task(self.async_get_machine_type())
+                progress_task = group.create_task(self._get_raw("/progress"))
+                working_state_task = group.create_task(
+                    self._get_raw("/system", _WORKING_STATE_PARAMS)
+                )
+                if include_peripheral:
+                    peripheral_task = group.create_task(self._get_optional_json("/peripherystatus"))
+        except* XToolApiError as err_group:
+            raise err_group.exceptions[0] from None
+
+        return SnapshotResponses(
+            machine_type=machine_type_task.result(),
+            progress=progress_task.result(),
+            working_state=working_state_task.result(),
+            peripheral=peripheral_task.result() if peripheral_task else None,
         )
 
-        return {
-            "progress": float(progress.get("progress", 0.0)),
-            "working": int(progress.get("working", 0)),
-            "line": int(progress.get("line", 0)),
-            "working_state": working_state,
-            "machine_type": machine_type,
-            "peripheral_status": peripheral,
-        }
+    def decode_snapshot(self, responses: SnapshotResponses) -> tuple[dict[str, Any], str]:
+        """Decode snapshot responses into the progress payload and working state."""
+        try:
+            progress = json_loads(responses.progress)
+            working_state = str(json_loads(responses.working_state).get("working", "0"))
+        except ValueError as err:
+            raise XToolApiError(f"Invalid JSON in snapshot from {self.base_url}: {err}") from err
+        return progress, working_state
 
     async def async_cnc_action(self, action: str) -> bool:
         """Run CNC control action (pause, resume, stop)."""
-        payload = await self._get_json("/cnc/data", params={"action": action})
+        params = _CNC_PARAMS.get(action) or {"action": action}
+        payload = await self._get_json("/cnc/data", params=params)
         return payload.get("result") == "ok"
 
     async def async_discover_devices(self, timeout: int = 3) -> list[dict[str, Any]]:
-        """Discover xTool devices via UDP broadcast."""
-        return await self._hass.async_add_executor_job(self._discover_devices_sync, timeout)
-
-    @staticmethod
-    def _discover_devices_sync(timeout: int) -> list[dict[str, Any]]:
-        """Perform blocking UDP discovery using protocol on port 20000."""
+        """Discover xTool devices via UDP broadcast on port 20000."""
         request_id = random.randint(100000, 999999)
-        payload = json.dumps({"requestId": request_id}).encode("utf-8")
-        found: dict[str, dict[str, Any]] = {}
+        payload = json_bytes({"requestId": request_id})
 
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         try:
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, "SO_REUSEPORT"):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            sock.setblocking(False)
             sock.bind(("", 20000))
-            sock.sendto(payload, ("255.255.255.255", 20000))
-
-            end_time = time.monotonic() + max(timeout, 1)
-            while time.monotonic() < end_time:
-                remaining = end_time - time.monotonic()
-                sock.settimeout(remaining)
-                try:
-                    data, _ = sock.recvfrom(4096)
-                except TimeoutError:
-                    break
-
-                try:
-                    message = json.loads(data.decode("utf-8", errors="ignore"))
-                except json.JSONDecodeError:
-                    continue
-
-                if message.get("requestId") != request_id:
-                    continue
-
-                host = str(message.get("ip", "")).strip()
-                if not host:
-                    continue
-
-                found[host] = {
-                    "host": host,
-                    "name": str(message.get("name", "xTool Laser")),
-                    "version": str(message.get("version", "")),
-                }
+            transport, protocol = await self._hass.loop.create_datagram_endpoint(
+                lambda: _DiscoveryProtocol(request_id), sock=sock
+            )
         except OSError:
+            sock.close()
             return []
+
+        try:
+            transport.sendto(payload, ("255.255.255.255", 20000))
+            await asyncio.sleep(max(timeout, 1))
         finally:
-            sock.close()
+            transport.close()
 
-        return list(found.values())
+        return list(protocol.found.values())
 
-    async def async_start_ws(
-        self, on_message: Callable[[str], Awaitable[None]]
-    ) -> None:
-        """Start persistent WebSocket listener task."""
+    async def async_start_ws(self, on_disconnect: Callable[[], Awaitable[None]] | None = None) -> None:
+        """Start persistent WebSocket listener task feeding ws_messages."""
         if self._ws_task and not self._ws_task.done():
             return
+        if self.ws_unavailable:
+            return
 
         self._ws_stop.clear()
-        self._ws_task = self._hass.loop.create_task(self._ws_loop(on_message))
+        self._ws_task = self._hass.loop.create_task(self._ws_loop(on_disconnect))
+
+    @property
+    def ws_unavailable(self) -> bool:
+        """Return whether the WebSocket was given up on after repeated failures."""
+        return not self._ws_ever_connected and self._ws_failures >= WS_MAX_CONNECT_FAILURES
 
     async def async_stop_ws(self) -> None:
         """Stop WebSocket listener task."""
@@ -180,22 +261,41 @@ class XToolApiClient:
                 await self._ws_task
             self._ws_task = None
 
-    async def _ws_loop(self, on_message: Callable[[str], Awaitable[None]]) -> None:
-        """Maintain WebSocket connection and forward messages."""
+    async def _ws_loop(self, on_disconnect: Callable[[], Awaitable[None]] | None) -> None:
+        """Maintain WebSocket connection and queue incoming messages."""
         while not self._ws_stop.is_set():
             try:
                 async with self._session.ws_connect(self.ws_url, heartbeat=30, timeout=15) as ws:
-                    async for msg in ws:
-                        if self._ws_stop.is_set():
-                            break
-                        if msg.type == aiohttp.WSMsgType.TEXT:
-                            await on_message(msg.data.strip())
-                        elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
-                            break
-            except (TimeoutError, ClientError):
-                pass
+                    self._ws_failures = 0
+                    self._ws_ever_connected = True
+                    self.ws_connected = True
+                    try:
+                        async for msg in ws:
+                            if self._ws_stop.is_set():
+                                break
+                            if msg.type == aiohttp.WSMsgType.TEXT:
+                                self._ws_backoff = WS_RECONNECT_MIN_DELAY
+                                await self.ws_messages.put(msg.data.strip())
+                            elif msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                                break
+                    finally:
+                        self.ws_connected = False
+                        if on_disconnect is not None and not self._ws_stop.is_set():
+                            await on_disconnect()
+            except (TimeoutError, ClientError) as err:
+                self._ws_failures += 1
+                if self.ws_unavailable:
+                    LOGGER.warning(
+                        "Giving up on WebSocket at %s after %s failed attempts, using HTTP polling only: %s",
+                        self.ws_url,
+                        self._ws_failures,
+                        err,
+                    )
+                    return
 
             if self._ws_stop.is_set():
                 return
 
-            await asyncio.sleep(5)
+            delay = self._ws_backoff
+            self._ws_backoff = min(delay * 2, WS_RECONNECT_MAX_DELAY)
+            await asyncio.sleep(delay + random.uniform(0, delay * 0.2))
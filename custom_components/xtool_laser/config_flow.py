@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import voluptuous as vol
@@ -21,14 +22,31 @@ from .const import (
     DOMAIN,
 )
 
+_MANUAL_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): str,
+        vol.Optional(CONF_NAME, default=DEFAULT_NAME): str,
+    }
+)
+
+_OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=60)
+        ),
+        vol.Required(CONF_USE_WEBSOCKET, default=True): bool,
+    }
+)
+
 
-async def _validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+async def _validate_input(
+    hass: HomeAssistant, data: dict[str, Any], discovered: bool = False
+) -> dict[str, Any]:
     api = XToolApiClient(hass, data[CONF_HOST])
-    if not await api.async_ping():
+    if not discovered and not await api.async_ping():
         raise CannotConnect
 
-    machine_type = await api.async_get_machine_type()
-    mac = await api.async_get_mac()
+    machine_type, mac = await asyncio.gather(api.async_get_machine_type(), api.async_get_mac())
     return {"title": data[CONF_NAME], "machine_type": machine_type, "mac": mac}
 
 
@@ -37,9 +55,11 @@ class XToolConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
     _discovered: dict[str, dict[str, Any]]
+    _discover_schema: vol.Schema | None
 
     def __init__(self) -> None:
         self._discovered = {}
+        self._discover_schema = None
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Show first setup menu."""
@@ -76,12 +96,7 @@ class XToolConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="manual",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_HOST): str,
-                    vol.Optional(CONF_NAME, default=DEFAULT_NAME): str,
-                }
-            ),
+            data_schema=_MANUAL_SCHEMA,
             errors=errors,
         )
 
@@ -93,18 +108,21 @@ class XToolConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             api = XToolApiClient(self.hass, "127.0.0.1")
             devices = await api.async_discover_devices(timeout=DEFAULT_DISCOVERY_TIMEOUT)
             self._discovered = {item["host"]: item for item in devices if item.get("host")}
+            self._discover_schema = None
 
         if not self._discovered:
             return self.async_abort(reason="no_devices_found")
 
-        hosts = sorted(self._discovered)
-
         if user_input is not None:
             chosen_host = user_input[CONF_HOST]
             chosen_name = user_input.get(CONF_NAME) or self._discovered[chosen_host].get("name") or DEFAULT_NAME
 
             try:
-                info = await _validate_input(self.hass, {CONF_HOST: chosen_host, CONF_NAME: chosen_name})
+                info = await _validate_input(
+                    self.hass,
+                    {CONF_HOST: chosen_host, CONF_NAME: chosen_name},
+                    discovered=True,
+                )
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except XToolApiError:
@@ -124,17 +142,20 @@ class XToolConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     },
                 )
 
-        default_host = hosts[0]
-        default_name = self._discovered[default_host].get("name") or DEFAULT_NAME
-
-        return self.async_show_form(
-            step_id="discover",
-            data_schema=vol.Schema(
+        if self._discover_schema is None:
+            hosts = sorted(self._discovered)
+            default_host = hosts[0]
+            default_name = self._discovered[default_host].get("name") or DEFAULT_NAME
+            self._discover_schema = vol.Schema(
                 {
                     vol.Required(CONF_HOST, default=default_host): vol.In(hosts),
                     vol.Optional(CONF_NAME, default=default_name): str,
                 }
-            ),
+            )
+
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=self._discover_schema,
             errors=errors,
         )
 
@@ -157,18 +178,7 @@ class XToolOptionsFlow(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_SCAN_INTERVAL,
-                        default=self._config_entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
-                    vol.Required(
-                        CONF_USE_WEBSOCKET,
-                        default=self._config_entry.options.get(CONF_USE_WEBSOCKET, True),
-                    ): bool,
-                }
-            ),
+            data_schema=self.add_suggested_values_to_schema(_OPTIONS_SCHEMA, self._config_entry.options),
         )
 
 
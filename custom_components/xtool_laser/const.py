@@ -6,6 +6,16 @@ DEFAULT_PORT = 8080
 DEFAULT_WS_PORT = 8081
 DEFAULT_SCAN_INTERVAL = 3
 DEFAULT_DISCOVERY_TIMEOUT = 3
+SNAPSHOT_MAX_AGE = 60
+PERIPHERAL_MAX_AGE = 90
+SNAPSHOT_FRESH_WINDOW = 2
+WS_RECONNECT_MIN_DELAY = 1
+WS_RECONNECT_MAX_DELAY = 60
+WS_MAX_CONNECT_FAILURES = 10
+WS_PERIPHERAL_REFRESH_INTERVAL = 30
+WS_IDLE_SCAN_INTERVAL = 30
+WS_COALESCE_DELAY = 0.05
+WS_QUEUE_SIZE = 128
 
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_USE_WEBSOCKET = "use_websocket"
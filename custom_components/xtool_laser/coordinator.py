@@ -2,25 +2,62 @@
 
 from __future__ import annotations
 
-import logging
+import asyncio
+from collections.abc import Mapping
+import contextlib
+from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache
+import logging
+import time
+from types import MappingProxyType
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import XToolApiClient, XToolApiError
-from .const import ATTR_WS_STATE, DOMAIN
+from .api import SnapshotResponses, XToolApiClient, XToolApiError
+from .const import (
+    DOMAIN,
+    PERIPHERAL_MAX_AGE,
+    SNAPSHOT_FRESH_WINDOW,
+    SNAPSHOT_MAX_AGE,
+    WS_COALESCE_DELAY,
+    WS_IDLE_SCAN_INTERVAL,
+    WS_PERIPHERAL_REFRESH_INTERVAL,
+)
+
+WORKING_STATE_LABELS = ("idle", "running_api", "running_button")
 
-WORKING_STATE_MAP = {
-    "0": "idle",
-    "1": "running_api",
-    "2": "running_button",
+PERIPHERAL_FLAGS = {
+    "sd_card_inserted": "sdCard",
+    "limit_stop_enabled": "limitStopFlag",
+    "tilt_stop_enabled": "tiltStopFlag",
+    "moving_stop_enabled": "movingStopFlag",
 }
 
 LOGGER = logging.getLogger(__name__)
 
 
-class XToolDataUpdateCoordinator(DataUpdateCoordinator[dict]):
+@dataclass(frozen=True, slots=True)
+class XToolSnapshot:
+    """Immutable polled xTool device state shared with entities."""
+
+    progress: float
+    working: int
+    line: int
+    working_state: str
+    machine_type: str
+    peripheral_status: Mapping[str, Any] | None
+    working_state_label: str
+    working_seconds: int
+    sd_card_inserted: bool | None
+    limit_stop_enabled: bool | None
+    tilt_stop_enabled: bool | None
+    moving_stop_enabled: bool | None
+
+
+class XToolDataUpdateCoordinator(DataUpdateCoordinator[XToolSnapshot]):
     """Coordinate xTool data updates."""
 
     def __init__(
@@ -33,38 +70,222 @@ class XToolDataUpdateCoordinator(DataUpdateCoordinator[dict]):
     ) -> None:
         super().__init__(
             hass,
-            logger=LOGGER,
+            logger=LOGGER.getChild(entry_id),
             name=f"{DOMAIN}_{entry_id}",
-            update_interval=timedelta(seconds=scan_interval),
+            update_interval=_interval(scan_interval),
+            always_update=False,
         )
         self.api = api
         self.entry_id = entry_id
-        self.use_websocket = use_websocket
+        self._use_websocket = use_websocket
+        self._scan_interval = scan_interval
+        self._ws_idle = False
+        self._ws_state: str | None = None
+        self._ws_flush_handle: asyncio.TimerHandle | None = None
+        self._ws_reader_task: asyncio.Task[None] | None = None
+        self._peripheral_refreshed_at = 0.0
+        self._snapshot_responses: SnapshotResponses | None = None
+        self._snapshot_stale_at = 0.0
+        self._last_fetch = 0.0
+        self._fetch_lock = asyncio.Lock()
+        self._refresh_requested = False
+        self._revalidate_task: asyncio.Task[None] | None = None
+
+    @property
+    def ws_state(self) -> str | None:
+        """Return the last WebSocket frame received."""
+        return self._ws_state
 
     async def async_start(self) -> None:
         """Start background listeners."""
-        if self.use_websocket:
-            await self.api.async_start_ws(self._async_handle_ws_message)
+        if self._use_websocket:
+            await self.api.async_start_ws(self._async_handle_ws_disconnect)
+            self._ws_reader_task = self.hass.async_create_background_task(
+                self._async_read_ws_messages(), name=f"{self.name} websocket reader"
+            )
 
     async def async_stop(self) -> None:
         """Stop background listeners."""
         await self.api.async_stop_ws()
+        if self._ws_reader_task is not None:
+            self._ws_reader_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._ws_reader_task
+            self._ws_reader_task = None
+        if self._ws_flush_handle is not None:
+            self._ws_flush_handle.cancel()
+            self._ws_flush_handle = None
+        if self._revalidate_task is not None:
+            self._revalidate_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._revalidate_task
+            self._revalidate_task = None
+
+    async def async_refresh(self) -> None:
+        """Refresh outside the regular poll schedule."""
+        # The debounced async_request_refresh lands here, while scheduled
+        # polls bypass this method, so the flag is only set for the
+        # duration of a requested refresh.
+        self._refresh_requested = True
+        try:
+            await super().async_refresh()
+        finally:
+            self._refresh_requested = False
 
-    async def _async_update_data(self) -> dict:
+    async def _async_update_data(self) -> XToolSnapshot:
         """Fetch latest data from device."""
+        # Refreshes requested right after a fetch are answered from the
+        # current data while a background task revalidates it. Scheduled
+        # polls always fetch inline so failures mark the entities unavailable.
+        if self._refresh_requested and self.data and time.monotonic() - self._last_fetch < SNAPSHOT_FRESH_WINDOW:
+            if self._revalidate_task is None or self._revalidate_task.done():
+                self._revalidate_task = self.hass.async_create_background_task(
+                    self._async_revalidate(), name=f"{self.name} revalidate"
+                )
+            return self.data
+
+        async with self._fetch_lock:
+            return await self._async_fetch_data()
+
+    async def _async_revalidate(self) -> None:
+        """Fetch fresh data in the background and push it to listeners."""
+        async with self._fetch_lock:
+            try:
+                data = await self._async_fetch_data()
+            except UpdateFailed as err:
+                self.async_set_update_error(err)
+                return
+        if data is not self.data or not self.last_update_success:
+            self.async_set_updated_data(data)
+
+    async def _async_fetch_data(self) -> XToolSnapshot:
+        """Fetch and derive a snapshot from the device."""
+        # While the WebSocket is pushing machine events, the slow-changing
+        # peripheral flags are refreshed on a longer interval.
+        now = time.monotonic()
+        refresh_peripheral = (
+            not self.data
+            or not self.api.ws_connected
+            or now - self._peripheral_refreshed_at >= WS_PERIPHERAL_REFRESH_INTERVAL
+        )
+
         try:
-            data = await self.api.async_get_snapshot()
+            responses = await self.api.async_get_snapshot(include_peripheral=refresh_peripheral)
         except XToolApiError as err:
             raise UpdateFailed(str(err)) from err
 
-        data["working_state_label"] = WORKING_STATE_MAP.get(data.get("working_state", "0"), "unknown")
-        if self.data and ATTR_WS_STATE in self.data:
-            data[ATTR_WS_STATE] = self.data[ATTR_WS_STATE]
+        # Identical raw responses are skipped without decoding, but a full
+        # rebuild is still forced periodically, and once the last peripheral
+        # status read is too old to reuse. A failed peripheral request has no
+        # status and is retried on the next poll.
+        peripheral_expired = now - self._peripheral_refreshed_at >= PERIPHERAL_MAX_AGE
+        if (
+            self.data
+            and now < self._snapshot_stale_at
+            and responses == self._snapshot_responses
+            and (responses.peripheral is not None or not peripheral_expired)
+        ):
+            if responses.peripheral is not None:
+                self._peripheral_refreshed_at = now
+            self._last_fetch = now
+            self._update_poll_interval(self.data)
+            return self.data
+
+        try:
+            progress, working_state = self.api.decode_snapshot(responses)
+        except XToolApiError as err:
+            raise UpdateFailed(str(err)) from err
+
+        self._snapshot_responses = responses
+        self._snapshot_stale_at = now + SNAPSHOT_MAX_AGE
+
+        # Safety flags that were never read, or whose last read has expired,
+        # are unknown rather than off.
+        peripheral: Mapping[str, Any] | None = None
+        if responses.peripheral is not None:
+            peripheral = MappingProxyType(responses.peripheral)
+            self._peripheral_refreshed_at = now
+        elif self.data and not peripheral_expired:
+            peripheral = self.data.peripheral_status
+        flags = {
+            key: bool(peripheral.get(field, 0)) if peripheral is not None else None
+            for key, field in PERIPHERAL_FLAGS.items()
+        }
+
+        working = int(progress.get("working", 0))
+        snapshot = XToolSnapshot(
+            progress=float(progress.get("progress", 0.0)),
+            working=working,
+            line=int(progress.get("line", 0)),
+            working_state=working_state,
+            machine_type=responses.machine_type,
+            peripheral_status=peripheral,
+            working_state_label=_working_state_label(working_state),
+            working_seconds=round(working / 1000),
+            **flags,
+        )
+
+        self._last_fetch = now
+        self._update_poll_interval(snapshot)
+
+        # Keep the existing object when nothing changed so identity checks
+        # (and always_update=False) skip the listener fan-out.
+        if self.data is not None and snapshot == self.data:
+            return self.data
+        return snapshot
+
+    def _update_poll_interval(self, data: XToolSnapshot) -> None:
+        """Pick the poll interval for the next refresh."""
+        # Progress is only available over HTTP, so polling is only relaxed
+        # while the WebSocket is live and the machine is idle. It is not
+        # switched off entirely so the peripheral flags do not go stale.
+        self._ws_idle = self.api.ws_connected and data.working_state_label == "idle"
+        self.update_interval = _interval(WS_IDLE_SCAN_INTERVAL if self._ws_idle else self._scan_interval)
+
+    async def _async_read_ws_messages(self) -> None:
+        """Drain the API's WebSocket queue for the lifetime of the listener."""
+        while True:
+            message = await self.api.ws_messages.get()
+            self._async_handle_ws_message(message)
+
+    @callback
+    def _async_handle_ws_message(self, message: str) -> None:
+        """Store incoming WebSocket state alongside the polled data."""
+        self._ws_state = message
+
+        # Bursts of frames are coalesced into one listener update.
+        if self._ws_flush_handle is None:
+            self._ws_flush_handle = self.hass.loop.call_later(WS_COALESCE_DELAY, self._flush_ws_update)
+
+    @callback
+    def _flush_ws_update(self) -> None:
+        """Push coalesced WebSocket state to listeners."""
+        self._ws_flush_handle = None
+        self.async_update_listeners()
+
+        # An event while idle usually means a job is starting. The refresh
+        # is scheduled rather than awaited so the queue keeps draining.
+        if self._ws_idle:
+            self.hass.async_create_background_task(
+                self.async_request_refresh(), name=f"{self.name} websocket refresh"
+            )
+
+    async def _async_handle_ws_disconnect(self) -> None:
+        """Resume regular polling when the WebSocket drops."""
+        self._ws_idle = False
+        self.update_interval = _interval(self._scan_interval)
+        await self.async_request_refresh()
+
+
+@lru_cache(maxsize=16)
+def _interval(seconds: int) -> timedelta:
+    """Return a shared timedelta for a poll interval in seconds."""
+    return timedelta(seconds=seconds)
 
-        return data
 
-    async def _async_handle_ws_message(self, message: str) -> None:
-        """Merge incoming WebSocket state into coordinator data."""
-        current = dict(self.data or {})
-        current[ATTR_WS_STATE] = message
-        self.async_set_updated_data(current)
+def _working_state_label(working_state: str | int) -> str:
+    """Map a working state code to its label."""
+    state = str(working_state)
+    if state.isdecimal() and (index := int(state)) < len(WORKING_STATE_LABELS):
+        return WORKING_STATE_LABELS[index]
+    return "unknown"
@@ -0,0 +1,36 @@
+"""Base entity for xTool Laser."""
+
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import XToolDataUpdateCoordinator
+
+
+class XToolEntity(CoordinatorEntity[XToolDataUpdateCoordinator]):
+    """Common base for entities of one xTool device."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: XToolDataUpdateCoordinator,
+        entry: ConfigEntry,
+        description: EntityDescription,
+    ) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+
+        machine_type = coordinator.data.machine_type if coordinator.data else None
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.entry_id)},
+            name=machine_type or "xTool Laser",
+            manufacturer="xTool",
+            model=machine_type or "Unknown",
+            configuration_url=coordinator.api.base_url,
+        )
@@ -10,17 +10,18 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import XToolDataUpdateCoordinator
+from .coordinator import XToolDataUpdateCoordinator, XToolSnapshot
+from .entity import XToolEntity
 
+PARALLEL_UPDATES = 0
 
-@dataclass(frozen=True, kw_only=True)
+
+@dataclass(frozen=True, slots=True, kw_only=True)
 class XToolSensorDescription(SensorEntityDescription):
     """Describe an xTool sensor."""
 
-    value_fn: Callable[[dict[str, Any]], Any]
+    value_fn: Callable[[XToolSnapshot], Any]
 
 
 SENSORS: tuple[XToolSensorDescription, ...] = (
@@ -29,38 +30,38 @@ SENSORS: tuple[XToolSensorDescription, ...] = (
         name="Job progress",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("progress"),
+        value_fn=lambda data: data.progress,
     ),
     XToolSensorDescription(
         key="working_seconds",
         name="Working time",
         native_unit_of_measurement=UnitOfTime.SECONDS,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: round((data.get("working", 0) or 0) / 1000),
+        value_fn=lambda data: data.working_seconds,
     ),
     XToolSensorDescription(
         key="line",
         name="Current G-code line",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("line"),
+        value_fn=lambda data: data.line,
     ),
     XToolSensorDescription(
         key="working_state",
         name="Working state",
-        value_fn=lambda data: data.get("working_state_label"),
-    ),
-    XToolSensorDescription(
-        key="ws_state",
-        name="Machine event",
-        value_fn=lambda data: data.get("ws_state"),
+        value_fn=lambda data: data.working_state_label,
     ),
     XToolSensorDescription(
         key="machine_type",
         name="Machine type",
-        value_fn=lambda data: data.get("machine_type"),
+        value_fn=lambda data: data.machine_type,
     ),
 )
 
+MACHINE_EVENT_SENSOR = SensorEntityDescription(
+    key="ws_state",
+    name="Machine event",
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -68,39 +69,27 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up xTool sensors."""
-    coordinator: XToolDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
-    async_add_entities(XToolSensor(coordinator, entry, description) for description in SENSORS)
+    coordinator: XToolDataUpdateCoordinator = entry.runtime_data
+    entities: list[SensorEntity] = [XToolSensor(coordinator, entry, description) for description in SENSORS]
+    entities.append(XToolMachineEventSensor(coordinator, entry, MACHINE_EVENT_SENSOR))
+    async_add_entities(entities)
 
 
-class XToolSensor(CoordinatorEntity[XToolDataUpdateCoordinator], SensorEntity):
+class XToolSensor(XToolEntity, SensorEntity):
     """Representation of an xTool sensor."""
 
     entity_description: XToolSensorDescription
 
-    def __init__(
-        self,
-        coordinator: XToolDataUpdateCoordinator,
-        entry: ConfigEntry,
-        description: XToolSensorDescription,
-    ) -> None:
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
-        self._attr_has_entity_name = True
-
     @property
     def native_value(self) -> Any:
         """Return sensor value."""
-        return self.entity_description.value_fn(self.coordinator.data or {})
+        return self.entity_description.value_fn(self.coordinator.data)
+
+
+class XToolMachineEventSensor(XToolEntity, SensorEntity):
+    """Representation of the xTool machine event sensor."""
 
     @property
-    def device_info(self) -> dict[str, Any]:
-        """Return shared device info."""
-        data = self.coordinator.data or {}
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry_id)},
-            "name": data.get("machine_type", "xTool Laser"),
-            "manufacturer": "xTool",
-            "model": data.get("machine_type", "Unknown"),
-            "configuration_url": f"http://{self.coordinator.api.host}:8080",
-        }
+    def native_value(self) -> str | None:
+        """Return the last WebSocket frame received."""
+        return self.coordinator.ws_state